@@ -6,14 +6,20 @@ in middleware deployments for FastMCP servers and FastAPI applications.
 """
 
 import asyncio
+import functools
+import heapq
+import itertools
+import logging
 import os
 import re
 import threading
 import time
+import traceback
 import uuid
-from collections import OrderedDict
-from collections.abc import Callable
-from dataclasses import dataclass, field
+import weakref
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass, field
 from re import Pattern
 from typing import Any
 
@@ -27,82 +33,107 @@ from .exceptions import (
     sanitization_timeout_error,
 )
 
+logger = logging.getLogger(__name__)
 
-class ReadWriteLock:
-    """
-    A reader-writer lock implementation for better cache concurrency.
+# The event loop only holds weak references to tasks, so running cleanup
+# tasks are kept here until they finish
+_background_tasks: set[asyncio.Task] = set()
 
-    Allows multiple concurrent readers but exclusive writers.
-    Prevents writer starvation by giving preference to writers when
-    readers are waiting.
+# Numbered or named backreferences change meaning inside a combined regex
+_BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=")
 
-    Attributes:
-        _readers: Number of active reader threads
-        _writers: Number of active writer threads
-        _read_ready: Condition variable for reader threads
-        _write_ready: Condition variable for writer threads
-    """
+# Traceback scrubbing, applied to every formatted traceback line
+_TRACEBACK_PATH = re.compile(r'File "([^"]*)/([^"/]+/[^"/]+)"')
+_TRACEBACK_LINENO = re.compile(r", line \d+")
+_MESSAGE_LINENO = re.compile(r"line \d+")
 
-    def __init__(self):
-        """Initialize the reader-writer lock."""
-        self._readers = 0
-        self._writers = 0
-        self._read_ready = threading.Condition(threading.RLock())
-        self._write_ready = threading.Condition(threading.RLock())
+# Below this many placeholders, repeated str.replace beats a regex pass
+_RESOLVE_MATCHER_MIN_PLACEHOLDERS = 16
 
-    def acquire_read(self):
-        """Acquire a read lock."""
-        with self._read_ready:
-            while self._writers > 0:
-                self._read_ready.wait()
-            self._readers += 1
+# Leaf types that can never hold a secret and need no recursion
+_SCALAR_TYPES = frozenset({bool, int, float, type(None)})
 
-    def release_read(self):
-        """Release a read lock."""
-        with self._read_ready:
-            self._readers -= 1
-            if self._readers == 0:
-                self._read_ready.notify_all()
 
-    def acquire_write(self):
-        """Acquire a write lock."""
-        with self._write_ready:
-            while self._writers > 0 or self._readers > 0:
-                self._write_ready.wait()
-            self._writers += 1
+def _to_bytes(value: str) -> bytes:
+    """Encode a value taken from a bytes payload back to its original bytes."""
+    return value.encode("utf-8", "surrogateescape")
 
-    def release_write(self):
-        """Release a write lock."""
-        with self._write_ready:
-            self._writers -= 1
-            self._write_ready.notify_all()
 
-        # Notify readers separately to avoid lock ordering issues
-        with self._read_ready:
-            self._read_ready.notify_all()
+def _unique_secrets(secrets: list["DetectedSecret"]) -> list["DetectedSecret"]:
+    """Keep one detection per distinct secret value, in first-seen order."""
+    return list({secret.value: secret for secret in secrets}.values())
 
-    def __enter__(self):
-        """Context manager for write lock."""
-        self.acquire_write()
-        return self
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager for write lock."""
-        self.release_write()
+def _union_matches(
+    union: Pattern[Any],
+    members: tuple[Pattern[Any], ...],
+    groups: dict[str, tuple[int, str, str]],
+    data: Any,
+) -> Iterable[tuple[int, int, str, str]]:
+    """
+    Yield ``(start, end, pattern name, template)`` for each union match.
 
+    An alternation stops at the first alternative that matches at a position,
+    which may only be a prefix of what a later pattern matches there. The
+    later patterns are retried at the same start and the longest match wins,
+    as it would when scanning pattern by pattern.
+    """
+    search = union.search
+    count = len(members)
+    pos = 0
+    while (match := search(data, pos)) is not None:
+        start, end = match.span()
+        index, name, template = groups[match.lastgroup]
+        for later in range(index + 1, count):
+            other = members[later].match(data, start)
+            if other is not None and other.end() > end:
+                end = other.end()
+                _, name, template = groups[f"_p{later}"]
+        yield start, end, name, template
+        pos = end if end > start else start + 1
+
+
+@functools.lru_cache(maxsize=128)
+def _placeholder_matcher(placeholders: frozenset[str]) -> Pattern[str]:
+    """Compile one alternation matching any of ``placeholders``, longest first."""
+    return re.compile(
+        "|".join(
+            re.escape(placeholder)
+            for placeholder in sorted(placeholders, key=len, reverse=True)
+        )
+    )
 
-class ReadLockContext:
-    """Context manager for read locks."""
 
-    def __init__(self, lock: ReadWriteLock):
-        self.lock = lock
+def _required_literal(pattern: Pattern[str]) -> str | None:
+    """
+    Return the longest literal that every match of ``pattern`` must contain.
 
-    def __enter__(self):
-        self.lock.acquire_read()
-        return self
+    Only literal runs at the top level of the pattern are considered, since
+    those are mandatory in any match. Returns None if there is no such run or
+    the pattern cannot be analysed (case-insensitive, bytes, parse failure).
+    The analysis relies on CPython's private regex parser; where it is not
+    available this returns None, which turns the prefilter off.
+    """
+    if not isinstance(pattern.pattern, str) or pattern.flags & re.IGNORECASE:
+        return None
+
+    try:
+        from re import _constants, _parser
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        self.lock.release_read()
+        items = _parser.parse(pattern.pattern, pattern.flags).data
+    except Exception:
+        return None
+
+    best = run = ""
+    for op, argument in items:
+        if op == _constants.LITERAL:
+            run += chr(argument)
+            if len(run) > len(best):
+                best = run
+        else:
+            run = ""
+
+    return best or None
 
 
 @dataclass
@@ -135,7 +166,7 @@ class SecretPattern:
         )
 
 
-@dataclass
+@dataclass(slots=True, weakref_slot=True)
 class DetectedSecret:
     """A secret that was detected in data."""
 
@@ -146,7 +177,7 @@ class DetectedSecret:
     end_pos: int = -1
 
 
-@dataclass
+@dataclass(slots=True, weakref_slot=True)
 class SanitizedData:
     """Data with secrets replaced by placeholders.
 
@@ -157,7 +188,8 @@ class SanitizedData:
         data: The sanitized data with placeholders replacing secrets
         placeholders: Mapping of placeholder strings to real secret values
         context_id: Unique identifier for this sanitization context
-        created_at: Timestamp when this data was sanitized
+        created_at: Monotonic clock reading (``time.monotonic()``) taken
+            when this data was sanitized, used for cache expiry
     """
 
     data: Any
@@ -165,14 +197,14 @@ class SanitizedData:
         default_factory=dict
     )  # placeholder -> real_value
     context_id: str = field(default_factory=lambda: str(uuid.uuid4()))
-    created_at: float = field(default_factory=time.time)
+    created_at: float = field(default_factory=time.monotonic)
 
     def get_real_value(self, placeholder: str) -> str | None:
         """Get the real value for a placeholder."""
         return self.placeholders.get(placeholder)
 
 
-@dataclass
+@dataclass(slots=True, weakref_slot=True)
 class ResolvedData:
     """Data with placeholders resolved back to real values."""
 
@@ -181,6 +213,22 @@ class ResolvedData:
     context_id: str = ""
 
 
+@dataclass(slots=True)
+class _PerformanceMetrics:
+    """Raw counters behind TemporalIsolationEngine.get_performance_metrics."""
+
+    sanitization_calls: int = 0
+    resolution_calls: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    secrets_detected: int = 0
+    total_sanitization_time: float = 0.0
+    total_resolution_time: float = 0.0
+    avg_sanitization_time: float = 0.0
+    avg_resolution_time: float = 0.0
+    performance_violations: int = 0
+
+
 class TemporalIsolationEngine:
     """
     Core engine for temporal isolation of secrets in middleware.
@@ -196,15 +244,22 @@ class TemporalIsolationEngine:
     Attributes:
         patterns: List of secret patterns for detection
         _compiled_patterns: Pre-compiled regex patterns for performance
-        _context_cache: LRU cache of sanitized contexts
+        _union_pattern: Single alternation of all patterns for one-pass scanning
+        _union_groups: Union group name -> (index, pattern name, template)
+        _union_members: Patterns in union order, retried for longest matches
+        _union_pattern_bytes: ASCII-only union recompiled for bytes payloads
+        _union_members_bytes: Union members recompiled for bytes payloads
+        _prefilter_literals: Literals a string must contain to possibly match
+        _context_cache: LRU cache of sanitized contexts, ordered oldest to newest
         _max_cache_size: Maximum number of cached contexts
         _max_cache_age: Maximum age of cached contexts in seconds
-        _cache_lock: Reader-writer lock for thread-safe cache access
+        _cache_lock: Mutex guarding cache writes and stats snapshots
+        _pending_touches: Cache hits awaiting LRU promotion by the next writer
         _cleanup_task: Background task for cache cleanup
         _enable_background_cleanup: Whether background cleanup is enabled
-        _last_access_times: Timestamp tracking for LRU cache
         _max_data_size: Maximum size limit for input data (DoS protection)
         _max_string_length: Maximum length for individual strings
+        _skip_keys: Dictionary keys whose values are not scanned
         _performance_metrics: Performance monitoring data
         _performance_callbacks: Registered performance event callbacks
     """
@@ -217,6 +272,7 @@ class TemporalIsolationEngine:
         enable_background_cleanup: bool = True,
         max_data_size: int = 10 * 1024 * 1024,  # 10MB default limit
         max_string_length: int = 1024 * 1024,  # 1MB per string
+        skip_keys: Iterable[str] | None = None,
     ):
         """
         Initialize the isolation engine.
@@ -228,6 +284,8 @@ class TemporalIsolationEngine:
             enable_background_cleanup: Whether to run background cache cleanup
             max_data_size: Maximum size in bytes for input data (DoS protection)
             max_string_length: Maximum length for individual strings (DoS protection)
+            skip_keys: Dictionary keys whose values are never scanned for secrets
+                (e.g. ``{"timestamp", "id"}``)
 
         Raises:
             ValueError: If cache size or age limits are invalid
@@ -237,34 +295,39 @@ class TemporalIsolationEngine:
 
         # Pre-compile regex patterns for better performance
         self._compiled_patterns: dict[str, Pattern[str]] = {}
+        self._union_pattern: Pattern[str] | None = None
+        self._union_groups: dict[str, tuple[int, str, str]] = {}
+        self._union_members: tuple[Pattern[str], ...] = ()
+        self._union_pattern_bytes: Pattern[bytes] | None = None
+        self._union_members_bytes: tuple[Pattern[bytes], ...] = ()
+        self._prefilter_literals: tuple[str, ...] | None = None
         self._compile_patterns()
 
         self._context_cache: OrderedDict[str, SanitizedData] = OrderedDict()
         self._max_cache_size = max_cache_size
         self._max_cache_age = max_cache_age
-        self._cache_lock = ReadWriteLock()  # Reader-writer lock for better concurrency
+        # Cache hits take no lock, so a plain mutex is cheaper than a
+        # reader-writer lock for the short write and stats sections left
+        self._cache_lock = threading.Lock()
+        self._pending_touches: deque[str] = deque()
+        self._created_at_total = 0.0  # Sum of created_at over cached contexts
+        self._expiry_heap: list[tuple[float, str]] = []  # (created_at, context_id)
         self._cleanup_task: asyncio.Task | None = None
         self._enable_background_cleanup = enable_background_cleanup
-        self._last_access_times: dict[str, float] = {}
 
         # Input validation limits for DoS protection
         self._max_data_size = max_data_size
         self._max_string_length = max_string_length
 
+        self._skip_keys = frozenset(skip_keys or ())
+
         # Performance monitoring
-        self._performance_metrics = {
-            "sanitization_calls": 0,
-            "resolution_calls": 0,
-            "cache_hits": 0,
-            "cache_misses": 0,
-            "secrets_detected": 0,
-            "total_sanitization_time": 0.0,
-            "total_resolution_time": 0.0,
-            "avg_sanitization_time": 0.0,
-            "avg_resolution_time": 0.0,
-            "performance_violations": 0,
-        }
-        self._performance_callbacks: list[Callable] = []
+        self._performance_metrics = _PerformanceMetrics()
+        self._reset_cache_counters()
+        # Copy-on-write (callback, is_coroutine_function) pairs: triggering
+        # iterates a snapshot that concurrent add/remove never mutates
+        self._performance_callbacks: tuple[tuple[Callable, bool], ...] = ()
+        self._callbacks_lock = threading.Lock()  # Serializes add/remove
 
         # Background cleanup will be started when first needed (lazy initialization)
 
@@ -286,11 +349,99 @@ class TemporalIsolationEngine:
                 self._compiled_patterns[pattern.name] = pattern.pattern
             except Exception as e:
                 # If pattern compilation fails, log error but continue
-                import logging
+                logger.warning(f"Failed to compile pattern '{pattern.name}': {e}")
 
-                logging.getLogger(__name__).warning(
-                    f"Failed to compile pattern '{pattern.name}': {e}"
+        self._compile_union_pattern()
+        self._compile_prefilter()
+
+    def _compile_union_pattern(self) -> None:
+        """
+        Combine all patterns into a single alternation regex.
+
+        Each pattern is wrapped in a named group (``_p0``, ``_p1``, ...) so a
+        string can be scanned once and ``match.lastgroup`` identifies which
+        pattern matched. Patterns that cannot be combined safely (non-default
+        flags, bytes patterns, backreferences) leave ``_union_pattern`` unset
+        and detection falls back to scanning with each pattern in turn.
+
+        When the combined source is pure ASCII it is also compiled as a bytes
+        pattern, so ``bytes``/``bytearray`` payloads are scanned in place.
+        """
+        self._union_pattern = None
+        self._union_pattern_bytes = None
+        self._union_groups = {}
+        self._union_members = ()
+        self._union_members_bytes = ()
+
+        sources = []
+        members = []
+        groups: dict[str, tuple[int, str, str]] = {}
+        for index, pattern in enumerate(self.patterns):
+            compiled = self._compiled_patterns.get(pattern.name) or pattern.pattern
+            if (
+                not isinstance(compiled, Pattern)
+                or not isinstance(compiled.pattern, str)
+                or compiled.flags != re.UNICODE
+                or _BACKREFERENCE.search(compiled.pattern)
+            ):
+                return
+
+            group_name = f"_p{index}"
+            sources.append(f"(?P<{group_name}>{compiled.pattern})")
+            members.append(compiled)
+            groups[group_name] = (index, pattern.name, pattern.placeholder_template)
+
+        if not sources:
+            return
+
+        try:
+            self._union_pattern = re.compile("|".join(sources))
+        except re.error:
+            # e.g. duplicate group names across patterns - scan one at a time
+            return
+
+        self._union_groups = groups
+        self._union_members = tuple(members)
+
+        if self._union_pattern.pattern.isascii():
+            try:
+                self._union_pattern_bytes = re.compile(
+                    self._union_pattern.pattern.encode("ascii")
+                )
+                self._union_members_bytes = tuple(
+                    re.compile(member.pattern.encode("ascii")) for member in members
                 )
+            except re.error:
+                self._union_pattern_bytes = None
+
+    def _compile_prefilter(self) -> None:
+        """
+        Collect the literals used to skip strings that cannot match.
+
+        Every pattern contributes its required literal; a string containing
+        none of them cannot match any pattern, so regex scanning is skipped.
+        Literals that contain a shorter collected literal are redundant and
+        dropped. If any pattern has no required literal the prefilter is
+        disabled, since such a pattern could match anywhere.
+        """
+        literals = set()
+        for pattern in self.patterns:
+            compiled = self._compiled_patterns.get(pattern.name) or pattern.pattern
+            literal = (
+                _required_literal(compiled) if isinstance(compiled, Pattern) else None
+            )
+            if literal is None:
+                self._prefilter_literals = None
+                return
+            literals.add(literal)
+
+        self._prefilter_literals = tuple(
+            sorted(
+                literal
+                for literal in literals
+                if not any(other != literal and other in literal for other in literals)
+            )
+        )
 
     def add_pattern(self, pattern: SecretPattern) -> None:
         """
@@ -307,11 +458,10 @@ class TemporalIsolationEngine:
         try:
             self._compiled_patterns[pattern.name] = pattern.pattern
         except Exception as e:
-            import logging
+            logger.warning(f"Failed to compile new pattern '{pattern.name}': {e}")
 
-            logging.getLogger(__name__).warning(
-                f"Failed to compile new pattern '{pattern.name}': {e}"
-            )
+        self._compile_union_pattern()
+        self._compile_prefilter()
 
     def remove_pattern(self, pattern_name: str) -> bool:
         """
@@ -329,6 +479,8 @@ class TemporalIsolationEngine:
 
         # Remove from compiled patterns
         self._compiled_patterns.pop(pattern_name, None)
+        self._compile_union_pattern()
+        self._compile_prefilter()
 
         return len(self.patterns) < original_count
 
@@ -336,62 +488,71 @@ class TemporalIsolationEngine:
         """
         Validate input data size to prevent DoS attacks.
 
+        Walks the data once, counting string characters plus one unit per
+        container element, and stops at the first string or running total
+        that exceeds its limit.
+
         Args:
             data: Input data to validate
 
         Raises:
             SanitizationError: If input exceeds size limits
         """
-        import sys
-
-        # Calculate approximate size of the data
-        data_size = sys.getsizeof(data)
-
-        # Check total data size
-        if data_size > self._max_data_size:
-            raise SanitizationError(
-                f"Input data size {data_size} bytes exceeds maximum limit of {self._max_data_size} bytes",
-                details={
-                    "data_size": data_size,
-                    "max_size": self._max_data_size,
-                    "suggestion": "Reduce input data size or increase max_data_size limit",
-                },
-            )
+        self._accumulate_input_size(data, "root", 0)
 
-        # Recursively check string lengths
-        self._validate_string_lengths(data)
-
-    def _validate_string_lengths(self, data: Any, path: str = "root") -> None:
+    def _accumulate_input_size(self, data: Any, path: str, total: int) -> int:
         """
-        Recursively validate string lengths in data structure.
+        Add the size of ``data`` to ``total``, enforcing both input limits.
 
         Args:
-            data: Data to validate
+            data: Data to measure
             path: Current path in data structure for error reporting
+            total: Size accumulated so far
+
+        Returns:
+            The updated running total
 
         Raises:
-            SanitizationError: If any string exceeds length limit
+            SanitizationError: If a string or the running total exceeds its limit
         """
-        if isinstance(data, str):
-            if len(data) > self._max_string_length:
+        if isinstance(data, str | bytes | bytearray):
+            size = len(data)
+            if size > self._max_string_length:
                 raise SanitizationError(
-                    f"String at {path} length {len(data)} exceeds maximum limit of {self._max_string_length}",
+                    f"String at {path} length {size} exceeds maximum limit of {self._max_string_length}",
                     details={
                         "path": path,
-                        "string_length": len(data),
+                        "string_length": size,
                         "max_length": self._max_string_length,
                         "suggestion": "Reduce string length or increase max_string_length limit",
                     },
                 )
+            total += size
         elif isinstance(data, dict):
+            total += len(data)
             for key, value in data.items():
-                self._validate_string_lengths(value, f"{path}.{key}")
+                total = self._accumulate_input_size(value, f"{path}.{key}", total)
         elif isinstance(data, list | tuple):
+            total += len(data)
             for i, item in enumerate(data):
-                self._validate_string_lengths(item, f"{path}[{i}]")
+                total = self._accumulate_input_size(item, f"{path}[{i}]", total)
         elif hasattr(data, "__dict__"):
             # Handle custom objects
-            self._validate_string_lengths(data.__dict__, f"{path}.__dict__")
+            return self._accumulate_input_size(data.__dict__, f"{path}.__dict__", total)
+        else:
+            return total
+
+        if total > self._max_data_size:
+            raise SanitizationError(
+                f"Input data size exceeds maximum limit of {self._max_data_size} bytes",
+                details={
+                    "data_size": total,
+                    "max_size": self._max_data_size,
+                    "suggestion": "Reduce input data size or increase max_data_size limit",
+                },
+            )
+
+        return total
 
     def _get_default_patterns(self) -> list[SecretPattern]:
         """Get default secret patterns from the pattern registry.
@@ -434,7 +595,7 @@ class TemporalIsolationEngine:
             SanitizationError: If data cannot be sanitized or exceeds size limits
             PerformanceError: If sanitization exceeds performance thresholds
         """
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
 
         if context_id is None:
             context_id = str(uuid.uuid4())
@@ -446,17 +607,17 @@ class TemporalIsolationEngine:
             self._start_background_cleanup()
 
             # Clean expired cache entries
-            await self._clean_expired_cache()
+            self._clean_expired_cache()
 
             # Detect secrets in the data
-            detected_secrets = await self._detect_secrets(data)
+            detected_secrets = self._detect_secrets(data)
 
             # Check performance threshold (do this regardless of secrets found)
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter_ns() - start_time) / 1_000_000
             if (
                 duration_ms > 5.0 and os.environ.get("CRYPTEX_SKIP_PERF_CHECKS") != "1"
             ):  # 5ms threshold
-                self._performance_metrics["performance_violations"] += 1
+                self._performance_metrics.performance_violations += 1
                 await self._trigger_performance_callbacks(
                     "sanitization_timeout",
                     {
@@ -473,9 +634,10 @@ class TemporalIsolationEngine:
                 self._update_sanitization_metrics(duration_ms, 0)
                 return SanitizedData(data=data, context_id=context_id)
 
-            # Replace secrets with placeholders
-            sanitized_data, placeholders = await self._replace_with_placeholders(
-                data, detected_secrets
+            # Replace secrets with placeholders; each distinct value only needs
+            # to be looked for once per string during the replacement walk
+            sanitized_data, placeholders = self._replace_with_placeholders(
+                data, _unique_secrets(detected_secrets)
             )
 
             # Create sanitized data object
@@ -487,7 +649,7 @@ class TemporalIsolationEngine:
             self._cache_context(context_id, result)
 
             # Update performance metrics
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter_ns() - start_time) / 1_000_000
             self._update_sanitization_metrics(duration_ms, len(detected_secrets))
 
             return result
@@ -504,6 +666,97 @@ class TemporalIsolationEngine:
                 cause=e,
             ) from e
 
+    async def sanitize_many(self, items: list[Any]) -> list[SanitizedData]:
+        """
+        Sanitize a batch of payloads, one context per item.
+
+        Equivalent to calling sanitize_for_ai for each item, but expired
+        contexts are purged once and all new contexts are cached under a
+        single lock acquisition, which suits bursts of MCP tool messages.
+
+        Args:
+            items: Raw payloads that may contain secrets
+
+        Returns:
+            SanitizedData for each item, in input order
+
+        Raises:
+            SanitizationError: If an item cannot be sanitized or exceeds size limits
+            PerformanceError: If the batch exceeds the per-item time budget
+        """
+        start_time = time.perf_counter_ns()
+
+        try:
+            for item in items:
+                self._validate_input_size(item)
+            self._start_background_cleanup()
+            self._clean_expired_cache()
+
+            results = []
+            to_cache = []
+            secrets_count = 0
+            for item in items:
+                context_id = str(uuid.uuid4())
+                detected_secrets = self._detect_secrets(item)
+                if not detected_secrets:
+                    results.append(SanitizedData(data=item, context_id=context_id))
+                    continue
+
+                sanitized_data, placeholders = self._replace_with_placeholders(
+                    item, _unique_secrets(detected_secrets)
+                )
+                result = SanitizedData(
+                    data=sanitized_data,
+                    placeholders=placeholders,
+                    context_id=context_id,
+                )
+                results.append(result)
+                to_cache.append(result)
+                secrets_count += len(detected_secrets)
+
+            # Same 5ms budget as sanitize_for_ai, applied per item
+            duration_ms = (time.perf_counter_ns() - start_time) / 1_000_000
+            threshold_ms = 5.0 * max(len(items), 1)
+            if (
+                duration_ms > threshold_ms
+                and os.environ.get("CRYPTEX_SKIP_PERF_CHECKS") != "1"
+            ):
+                self._performance_metrics.performance_violations += 1
+                await self._trigger_performance_callbacks(
+                    "sanitization_timeout",
+                    {
+                        "duration_ms": duration_ms,
+                        "threshold_ms": threshold_ms,
+                        "batch_size": len(items),
+                    },
+                )
+                raise sanitization_timeout_error(duration_ms, threshold_ms)
+
+            if to_cache:
+                with self._cache_lock:  # One lock acquisition for the whole batch
+                    self._apply_pending_touches()
+                    for result in to_cache:
+                        self._store_context(result.context_id, result)
+                    self._enforce_cache_size_limit()
+
+            if items:
+                self._update_sanitization_metrics(
+                    duration_ms, secrets_count, calls=len(items)
+                )
+
+            return results
+
+        except Exception as e:
+            if isinstance(e, SanitizationError | PerformanceError):
+                raise
+
+            # Wrap unexpected errors
+            raise SanitizationError(
+                f"Failed to sanitize batch: {str(e)}",
+                details={"batch_size": len(items), "error": str(e)},
+                cause=e,
+            ) from e
+
     async def resolve_for_execution(self, data: Any, context_id: str) -> ResolvedData:
         """
         Resolve placeholders back to real values for tool execution.
@@ -520,7 +773,7 @@ class TemporalIsolationEngine:
             ResolutionError: If placeholder resolution fails
             PerformanceError: If resolution exceeds performance thresholds
         """
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
 
         try:
             # Get the sanitized context with access tracking
@@ -528,18 +781,23 @@ class TemporalIsolationEngine:
             if not sanitized_context:
                 raise context_not_found_error(context_id)
 
-            # Resolve placeholders in the data
-            resolved_data, resolved_count = await self._resolve_placeholders(
-                data, sanitized_context.placeholders
-            )
+            # Resolve placeholders in the data; nothing to walk for without any
+            if sanitized_context.placeholders:
+                resolved_data, resolved_count = self._resolve_placeholders(
+                    data,
+                    sanitized_context.placeholders,
+                    self._get_resolve_matcher(sanitized_context),
+                )
+            else:
+                resolved_data, resolved_count = data, 0
 
             # Update performance metrics
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter_ns() - start_time) / 1_000_000
             self._update_resolution_metrics(duration_ms, resolved_count)
 
             # Check performance threshold
             if duration_ms > 10.0:  # 10ms threshold
-                self._performance_metrics["performance_violations"] += 1
+                self._performance_metrics.performance_violations += 1
                 await self._trigger_performance_callbacks(
                     "resolution_timeout",
                     {
@@ -585,32 +843,55 @@ class TemporalIsolationEngine:
             return result.data
 
         # Replace any real values that might have leaked into response
-        sanitized_response = await self._replace_real_values_with_placeholders(
+        sanitized_response = self._replace_real_values_with_placeholders(
             response, sanitized_context.placeholders
         )
 
         return sanitized_response
 
-    async def _detect_secrets(self, data: Any) -> list[DetectedSecret]:
+    def _detect_secrets(self, data: Any) -> list[DetectedSecret]:
         """Detect secrets in various data types."""
         detected_secrets = []
 
         if isinstance(data, str):
-            detected_secrets.extend(await self._detect_secrets_in_string(data))
+            detected_secrets.extend(self._detect_secrets_in_string(data))
+        elif isinstance(data, bytes | bytearray):
+            detected_secrets.extend(self._detect_secrets_in_bytes(data))
         elif isinstance(data, dict):
-            detected_secrets.extend(await self._detect_secrets_in_dict(data))
+            detected_secrets.extend(self._detect_secrets_in_dict(data))
         elif isinstance(data, list | tuple):
-            detected_secrets.extend(await self._detect_secrets_in_list(data))
+            detected_secrets.extend(self._detect_secrets_in_list(data))
         elif hasattr(data, "__dict__"):
             # Handle custom objects
-            detected_secrets.extend(await self._detect_secrets_in_dict(data.__dict__))
+            detected_secrets.extend(self._detect_secrets_in_dict(data.__dict__))
 
         return detected_secrets
 
-    async def _detect_secrets_in_string(self, text: str) -> list[DetectedSecret]:
+    def _detect_secrets_in_string(self, text: str) -> list[DetectedSecret]:
         """Detect secrets in a string using pre-compiled patterns."""
         detected = []
 
+        if self._prefilter_literals is not None and not any(
+            literal in text for literal in self._prefilter_literals
+        ):
+            return detected
+
+        if self._union_pattern is not None:
+            # Single pass over the text for all patterns; per-pattern data is
+            # precomputed in _union_groups and hot lookups bound to locals
+            generate = self._generate_placeholder
+            append = detected.append
+            for start, end, name, template in _union_matches(
+                self._union_pattern, self._union_members, self._union_groups, text
+            ):
+                value = text[start:end]
+                append(
+                    DetectedSecret(
+                        value, name, generate(value, name, template), start, end
+                    )
+                )
+            return detected
+
         for pattern in self.patterns:
             # Use pre-compiled pattern for better performance
             compiled_pattern = self._compiled_patterns.get(pattern.name)
@@ -635,26 +916,57 @@ class TemporalIsolationEngine:
 
         return detected
 
-    async def _detect_secrets_in_dict(
-        self, data: dict[str, Any]
-    ) -> list[DetectedSecret]:
+    def _detect_secrets_in_bytes(self, data: bytes | bytearray) -> list[DetectedSecret]:
+        """
+        Detect secrets in raw bytes.
+
+        Uses the bytes-compiled union pattern so the buffer is scanned without
+        decoding it first; only matched values are decoded. Falls back to the
+        string path when no bytes pattern is available. Decoding uses
+        ``surrogateescape`` so the original bytes can always be restored.
+        """
+        if self._union_pattern_bytes is None:
+            return self._detect_secrets_in_string(
+                data.decode("utf-8", "surrogateescape")
+            )
+
+        detected: list[DetectedSecret] = []
+        generate = self._generate_placeholder
+        append = detected.append
+        for start, end, name, template in _union_matches(
+            self._union_pattern_bytes,
+            self._union_members_bytes,
+            self._union_groups,
+            data,
+        ):
+            value = data[start:end].decode("utf-8", "surrogateescape")
+            append(
+                DetectedSecret(value, name, generate(value, name, template), start, end)
+            )
+        return detected
+
+    def _detect_secrets_in_dict(self, data: dict[str, Any]) -> list[DetectedSecret]:
         """Detect secrets in a dictionary."""
         detected = []
+        skip_keys = self._skip_keys
 
-        for _key, value in data.items():
+        for key, value in data.items():
+            if type(value) in _SCALAR_TYPES or key in skip_keys:
+                continue
             if isinstance(value, str):
-                detected.extend(await self._detect_secrets_in_string(value))
-            elif isinstance(value, dict | list | tuple):
-                detected.extend(await self._detect_secrets(value))
+                detected.extend(self._detect_secrets_in_string(value))
+            elif isinstance(value, dict | list | tuple | bytes | bytearray):
+                detected.extend(self._detect_secrets(value))
 
         return detected
 
-    async def _detect_secrets_in_list(self, data: list[Any]) -> list[DetectedSecret]:
+    def _detect_secrets_in_list(self, data: list[Any]) -> list[DetectedSecret]:
         """Detect secrets in a list."""
         detected = []
 
         for item in data:
-            detected.extend(await self._detect_secrets(item))
+            if type(item) not in _SCALAR_TYPES:
+                detected.extend(self._detect_secrets(item))
 
         return detected
 
@@ -675,26 +987,33 @@ class TemporalIsolationEngine:
         # This ensures consistent behavior across all secret types
         return template
 
-    async def _replace_with_placeholders(
+    def _replace_with_placeholders(
         self, data: Any, secrets: list[DetectedSecret]
     ) -> tuple[Any, dict[str, str]]:
         """Replace detected secrets with placeholders using optimized algorithm."""
         if not secrets:
             return data, {}
 
-        placeholders = {}
+        placeholders: dict[str, str] = {}
+        return self._replace_in_structure(data, secrets, placeholders), placeholders
 
-        if isinstance(data, str):
-            # Optimized single-pass replacement for strings
-            sanitized_data = self._replace_secrets_in_string(
-                data, secrets, placeholders
-            )
-            return sanitized_data, placeholders
+    def _replace_in_structure(
+        self, data: Any, secrets: list[DetectedSecret], placeholders: dict[str, str]
+    ) -> Any:
+        """
+        Recursively replace secrets, recording placeholders in one shared map.
+
+        Nested containers write into the caller's ``placeholders`` dict
+        instead of returning their own map to be merged at every level.
+        """
+        if isinstance(data, str | bytes | bytearray):
+            # Optimized single-pass replacement for strings and bytes
+            return self._replace_secrets_in_string(data, secrets, placeholders)
 
         elif isinstance(data, dict):
             sanitized_data = {}
             for key, value in data.items():
-                if isinstance(value, str):
+                if isinstance(value, str | bytes | bytearray):
                     # Find relevant secrets for this specific string value
                     relevant_secrets = self._find_relevant_secrets(value, secrets)
                     if relevant_secrets:
@@ -706,20 +1025,17 @@ class TemporalIsolationEngine:
                         sanitized_data[key] = value
                 elif isinstance(value, dict | list | tuple):
                     # Recursively handle nested structures
-                    (
-                        sanitized_value,
-                        nested_placeholders,
-                    ) = await self._replace_with_placeholders(value, secrets)
-                    sanitized_data[key] = sanitized_value
-                    placeholders.update(nested_placeholders)
+                    sanitized_data[key] = self._replace_in_structure(
+                        value, secrets, placeholders
+                    )
                 else:
                     sanitized_data[key] = value
-            return sanitized_data, placeholders
+            return sanitized_data
 
         elif isinstance(data, list | tuple):
             sanitized_data = []
             for item in data:
-                if isinstance(item, str):
+                if isinstance(item, str | bytes | bytearray):
                     # Find relevant secrets for this specific string item
                     relevant_secrets = self._find_relevant_secrets(item, secrets)
                     if relevant_secrets:
@@ -731,25 +1047,51 @@ class TemporalIsolationEngine:
                         sanitized_data.append(item)
                 elif isinstance(item, dict | list | tuple):
                     # Recursively handle nested structures
-                    (
-                        sanitized_item,
-                        nested_placeholders,
-                    ) = await self._replace_with_placeholders(item, secrets)
-                    sanitized_data.append(sanitized_item)
-                    placeholders.update(nested_placeholders)
+                    sanitized_data.append(
+                        self._replace_in_structure(item, secrets, placeholders)
+                    )
                 else:
                     sanitized_data.append(item)
-            return sanitized_data, placeholders
+            return sanitized_data
 
-        return data, {}
+        return data
 
-    async def _resolve_placeholders(
-        self, data: Any, placeholder_map: dict[str, str]
+    def _get_resolve_matcher(self, context: SanitizedData) -> Pattern[str] | None:
+        """
+        Return a regex matching any placeholder of a context, if worthwhile.
+
+        Large placeholder maps are resolved in one regex pass per string
+        instead of one ``str.replace`` per placeholder. Compiled regexes are
+        cached by the exact set of placeholders, so a map that gains or loses
+        entries after an earlier resolve gets a matching regex. Small maps
+        return None, since a few ``str.replace`` calls are faster than the
+        regex callback.
+        """
+        if len(context.placeholders) < _RESOLVE_MATCHER_MIN_PLACEHOLDERS:
+            return None
+
+        return _placeholder_matcher(frozenset(context.placeholders))
+
+    def _resolve_placeholders(
+        self,
+        data: Any,
+        placeholder_map: dict[str, str],
+        matcher: Pattern[str] | None = None,
     ) -> tuple[Any, int]:
         """Resolve placeholders back to real values."""
         resolved_count = 0
 
-        if isinstance(data, str):
+        if isinstance(data, str) and matcher is not None:
+            found = set()
+
+            def substitute(match: re.Match[str]) -> str:
+                placeholder = match.group()
+                found.add(placeholder)
+                return placeholder_map[placeholder]
+
+            return matcher.sub(substitute, data), len(found)
+
+        elif isinstance(data, str):
             resolved_data = data
             for placeholder, real_value in placeholder_map.items():
                 if placeholder in resolved_data:
@@ -757,11 +1099,22 @@ class TemporalIsolationEngine:
                     resolved_count += 1
             return resolved_data, resolved_count
 
+        elif isinstance(data, bytes | bytearray):
+            resolved_bytes = data
+            for placeholder, real_value in placeholder_map.items():
+                encoded_placeholder = _to_bytes(placeholder)
+                if encoded_placeholder in resolved_bytes:
+                    resolved_bytes = resolved_bytes.replace(
+                        encoded_placeholder, _to_bytes(real_value)
+                    )
+                    resolved_count += 1
+            return resolved_bytes, resolved_count
+
         elif isinstance(data, dict):
             resolved_data = {}
             for key, value in data.items():
-                resolved_value, count = await self._resolve_placeholders(
-                    value, placeholder_map
+                resolved_value, count = self._resolve_placeholders(
+                    value, placeholder_map, matcher
                 )
                 resolved_data[key] = resolved_value
                 resolved_count += count
@@ -770,8 +1123,8 @@ class TemporalIsolationEngine:
         elif isinstance(data, list | tuple):
             resolved_data = []
             for item in data:
-                resolved_item, count = await self._resolve_placeholders(
-                    item, placeholder_map
+                resolved_item, count = self._resolve_placeholders(
+                    item, placeholder_map, matcher
                 )
                 resolved_data.append(resolved_item)
                 resolved_count += count
@@ -779,22 +1132,70 @@ class TemporalIsolationEngine:
 
         return data, resolved_count
 
-    async def _replace_real_values_with_placeholders(
+    def _replace_real_values_with_placeholders(
         self, data: Any, placeholder_map: dict[str, str]
     ) -> Any:
-        """Replace any real values that leaked into response with placeholders."""
+        """
+        Replace any real values that leaked into response with placeholders.
+
+        All real values are combined into one literal alternation (longest
+        first) so each string is scanned once, however many secrets the
+        context holds. Bytes payloads get the same alternation over the
+        values' original bytes, matching how they were resolved.
+        """
+        real_to_placeholder = {
+            real_value: placeholder
+            for placeholder, real_value in placeholder_map.items()
+            if real_value
+        }
+        if not real_to_placeholder:
+            return data
+
+        ordered = sorted(real_to_placeholder, key=len, reverse=True)
+        matcher = re.compile("|".join(re.escape(real_value) for real_value in ordered))
+        return self._replace_leaked_values(data, matcher, real_to_placeholder, {})
+
+    def _replace_leaked_values(
+        self,
+        data: Any,
+        matcher: Pattern[str],
+        real_to_placeholder: dict[str, str],
+        bytes_state: dict[str, Any],
+    ) -> Any:
+        """
+        Apply a real-value matcher throughout a data structure.
+
+        The bytes matcher is only compiled, into ``bytes_state``, the first
+        time a bytes value is reached, so text-only responses never pay for it.
+        """
         if isinstance(data, str):
-            sanitized = data
-            for placeholder, real_value in placeholder_map.items():
-                if real_value in sanitized:
-                    sanitized = sanitized.replace(real_value, placeholder)
-            return sanitized
+            return matcher.sub(lambda m: real_to_placeholder[m.group()], data)
+
+        elif isinstance(data, bytes | bytearray):
+            if not bytes_state:
+                bytes_state["map"] = {
+                    _to_bytes(real_value): _to_bytes(placeholder)
+                    for real_value, placeholder in real_to_placeholder.items()
+                }
+                bytes_state["matcher"] = re.compile(
+                    b"|".join(
+                        re.escape(_to_bytes(real_value))
+                        for real_value in sorted(
+                            real_to_placeholder, key=len, reverse=True
+                        )
+                    )
+                )
+            bytes_to_placeholder = bytes_state["map"]
+            replaced = bytes_state["matcher"].sub(
+                lambda m: bytes_to_placeholder[m.group()], data
+            )
+            return bytearray(replaced) if isinstance(data, bytearray) else replaced
 
         elif isinstance(data, dict):
             sanitized = {}
             for key, value in data.items():
-                sanitized[key] = await self._replace_real_values_with_placeholders(
-                    value, placeholder_map
+                sanitized[key] = self._replace_leaked_values(
+                    value, matcher, real_to_placeholder, bytes_state
                 )
             return sanitized
 
@@ -802,8 +1203,8 @@ class TemporalIsolationEngine:
             sanitized = []
             for item in data:
                 sanitized.append(
-                    await self._replace_real_values_with_placeholders(
-                        item, placeholder_map
+                    self._replace_leaked_values(
+                        item, matcher, real_to_placeholder, bytes_state
                     )
                 )
             return sanitized
@@ -811,9 +1212,12 @@ class TemporalIsolationEngine:
         return data
 
     def _find_relevant_secrets(
-        self, text: str, secrets: list[DetectedSecret]
+        self, text: str | bytes | bytearray, secrets: list[DetectedSecret]
     ) -> list[DetectedSecret]:
         """Find secrets that are actually present in the given text."""
+        if not isinstance(text, str):
+            return [secret for secret in secrets if _to_bytes(secret.value) in text]
+
         relevant = []
         for secret in secrets:
             if secret.value in text:
@@ -821,38 +1225,59 @@ class TemporalIsolationEngine:
         return relevant
 
     def _replace_secrets_in_string(
-        self, text: str, secrets: list[DetectedSecret], placeholders: dict[str, str]
-    ) -> str:
+        self,
+        text: str | bytes | bytearray,
+        secrets: list[DetectedSecret],
+        placeholders: dict[str, str],
+    ) -> Any:
         """
         Optimized single-pass replacement of secrets in a string.
 
-        Uses sorted positions to ensure correct replacement without position shifts.
+        Collects every occurrence, then builds the result in one forward sweep
+        so the cost is linear in the text length. Overlapping occurrences are
+        skipped, with the longest match winning at any given position.
+        ``bytes`` and ``bytearray`` input is rewritten in place of its own type.
+
+        Callers pass one detection per value (see ``_unique_secrets``), since
+        each search already finds all occurrences of that value.
         """
         if not secrets:
             return text
 
+        as_bytes = not isinstance(text, str)
+
         # Build a list of all replacement positions
         replacements = []
         for secret in secrets:
+            value = _to_bytes(secret.value) if as_bytes else secret.value
+            placeholder = (
+                _to_bytes(secret.placeholder) if as_bytes else secret.placeholder
+            )
             # Find all occurrences of this secret in the text
             start = 0
             while True:
-                pos = text.find(secret.value, start)
+                pos = text.find(value, start)
                 if pos == -1:
                     break
-                replacements.append((pos, pos + len(secret.value), secret.placeholder))
+                replacements.append((pos, pos + len(value), placeholder))
                 placeholders[secret.placeholder] = secret.value
                 start = pos + 1
 
-        # Sort replacements by position in reverse order
-        replacements.sort(key=lambda x: x[0], reverse=True)
+        # Sort by position, longest match first when two start together
+        replacements.sort(key=lambda x: (x[0], -x[1]))
 
-        # Apply replacements from end to beginning to maintain positions
-        result = text
+        parts = []
+        pos = 0
         for start_pos, end_pos, placeholder in replacements:
-            result = result[:start_pos] + placeholder + result[end_pos:]
+            if start_pos < pos:
+                # Overlaps a range that was already replaced
+                continue
+            parts.append(text[pos:start_pos])
+            parts.append(placeholder)
+            pos = end_pos
+        parts.append(text[pos:])
 
-        return result
+        return text[:0].join(parts)
 
     def _start_background_cleanup(self) -> None:
         """Start background cache cleanup task if event loop is available."""
@@ -863,90 +1288,162 @@ class TemporalIsolationEngine:
             # Only start if we have a running event loop
             loop = asyncio.get_running_loop()
             if self._cleanup_task is None or self._cleanup_task.done():
-                self._cleanup_task = loop.create_task(self._background_cleanup_loop())
+                task = loop.create_task(
+                    self._background_cleanup_loop(weakref.ref(self))
+                )
+                _background_tasks.add(task)
+                task.add_done_callback(_background_tasks.discard)
+                self._cleanup_task = task
         except RuntimeError:
             # No event loop running, background cleanup will start later
             pass
 
-    async def _background_cleanup_loop(self) -> None:
-        """Background task to periodically clean expired cache entries."""
-        cleanup_interval = min(
-            300, self._max_cache_age // 6
-        )  # Clean every 5 minutes or 1/6 of max age
+    @staticmethod
+    async def _background_cleanup_loop(
+        engine_ref: "weakref.ref[TemporalIsolationEngine]",
+    ) -> None:
+        """
+        Background task to periodically clean expired cache entries.
 
+        The task holds the engine only through a weak reference between
+        passes, so the strong reference in ``_background_tasks`` never keeps
+        an otherwise unused engine alive; the loop ends once it is collected.
+        """
         while True:
             try:
-                await asyncio.sleep(cleanup_interval)
-                await self._clean_expired_cache()
-                self._enforce_cache_size_limit()
+                engine = engine_ref()
+                if engine is None:
+                    break
+
+                # Wake when the oldest context expires, but at least every
+                # 5 minutes or 1/6 of max age, and at most once a second
+                max_cache_age = engine._max_cache_age
+                delay = min(300, max_cache_age // 6)
+                head = engine._expiry_heap[:1]
+                if head:
+                    until_expiry = head[0][0] + max_cache_age - time.monotonic()
+                    delay = min(delay, until_expiry)
+                del engine
+
+                await asyncio.sleep(max(1.0, delay))
+
+                engine = engine_ref()
+                if engine is None:
+                    break
+                engine._clean_expired_cache()
+                with engine._cache_lock:
+                    engine._enforce_cache_size_limit()
+                del engine
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 # Log error but continue cleanup loop
-                import logging
-
-                logging.getLogger(__name__).warning(f"Cache cleanup error: {e}")
+                logger.warning(f"Cache cleanup error: {e}")
 
     def _cache_context(self, context_id: str, context: SanitizedData) -> None:
-        """Cache a context with LRU eviction using write lock."""
-        with self._cache_lock:  # Write lock for cache modification
-            # Remove if already exists (to update position)
-            if context_id in self._context_cache:
-                del self._context_cache[context_id]
+        """Cache a context with LRU eviction under the cache lock."""
+        with self._cache_lock:  # Lock for cache modification
+            # Replay earlier hits first so recency order stays exact
+            self._apply_pending_touches()
 
-            # Add to end (most recently used)
-            self._context_cache[context_id] = context
-            self._last_access_times[context_id] = time.time()
+            self._store_context(context_id, context)
 
             # Enforce size limit
             self._enforce_cache_size_limit()
 
+    def _store_context(self, context_id: str, context: SanitizedData) -> None:
+        """Add or update a context as most recently used. Requires the cache lock."""
+        previous = self._context_cache.get(context_id)
+        if previous is not None:
+            self._created_at_total -= previous.created_at
+
+        self._context_cache[context_id] = context
+        self._context_cache.move_to_end(context_id)
+        self._created_at_total += context.created_at
+
+        # Scale with the live cache too: a batch may cache far more than
+        # max_cache_size before eviction runs, and a fixed bound would then
+        # rebuild the heap on every insert
+        if len(self._expiry_heap) >= 2 * max(
+            self._max_cache_size, len(self._context_cache)
+        ):
+            # Mostly entries for evicted or cleared contexts; rebuild from live ones
+            self._expiry_heap = [
+                (cached.created_at, cached_id)
+                for cached_id, cached in self._context_cache.items()
+            ]
+            heapq.heapify(self._expiry_heap)
+        else:
+            heapq.heappush(self._expiry_heap, (context.created_at, context_id))
+
     def _get_cached_context(self, context_id: str) -> SanitizedData | None:
-        """Get a cached context and update access time (LRU)."""
-        # First try to get with read lock
-        with ReadLockContext(self._cache_lock):
-            context = self._context_cache.get(context_id)
-            if context:
-                # Update metrics immediately
-                self._performance_metrics["cache_hits"] += 1
-            else:
-                self._performance_metrics["cache_misses"] += 1
-                return None
-
-        # If found, update access time with write lock
-        if context:
-            with self._cache_lock:  # Write lock for LRU update
-                # Double-check the context still exists
-                if context_id in self._context_cache:
-                    # Move to end (mark as recently used)
-                    del self._context_cache[context_id]
-                    self._context_cache[context_id] = context
-                    self._last_access_times[context_id] = time.time()
-                    return context
+        """
+        Get a cached context and record the access for LRU ordering.
 
-        return None
+        Lookups take no lock: a single dict read is atomic, and the cache is
+        only mutated under the cache lock. The LRU promotion is queued and
+        replayed by the next writer, before it inserts or evicts anything.
+        """
+        context = self._context_cache.get(context_id)
+        if context is None:
+            self._performance_metrics.cache_misses = next(self._cache_miss_counter)
+            return None
+
+        self._performance_metrics.cache_hits = next(self._cache_hit_counter)
+        self._pending_touches.append(context_id)
+
+        # Read-heavy workloads: don't let the queue outgrow the cache itself
+        if len(self._pending_touches) > self._max_cache_size:
+            with self._cache_lock:
+                self._apply_pending_touches()
+
+        return context
+
+    def _apply_pending_touches(self) -> None:
+        """Move queued cache hits to the recent end. Requires the cache lock."""
+        while self._pending_touches:
+            context_id = self._pending_touches.popleft()
+            if context_id in self._context_cache:
+                self._context_cache.move_to_end(context_id)
 
     def _enforce_cache_size_limit(self) -> None:
         """Enforce cache size limit by evicting least recently used entries."""
+        self._apply_pending_touches()
         while len(self._context_cache) > self._max_cache_size:
             # Remove oldest entry (least recently used)
-            oldest_context_id, _ = self._context_cache.popitem(last=False)
-            self._last_access_times.pop(oldest_context_id, None)
-
-    async def _clean_expired_cache(self) -> None:
-        """Remove expired contexts from cache."""
-        current_time = time.time()
-
-        with self._cache_lock:  # Write lock for cache modification
-            expired_keys = [
-                context_id
-                for context_id, context in self._context_cache.items()
-                if current_time - context.created_at > self._max_cache_age
-            ]
+            _, evicted = self._context_cache.popitem(last=False)
+            self._created_at_total -= evicted.created_at
+
+    def _clean_expired_cache(self) -> None:
+        """
+        Remove expired contexts from cache.
+
+        Contexts are popped from a min-heap ordered by creation time, so a
+        pass only visits entries that have actually expired. Heap entries for
+        contexts that were evicted, cleared or re-cached since are skipped.
+        """
+        current_time = time.monotonic()
+
+        # Nothing has expired yet: skip the cache lock entirely. Slicing reads
+        # the heap head atomically even if a writer is pushing concurrently.
+        head = self._expiry_heap[:1]
+        if not head or current_time - head[0][0] <= self._max_cache_age:
+            return
+
+        with self._cache_lock:  # Lock for cache modification
+            heap = self._expiry_heap
+            while heap and current_time - heap[0][0] > self._max_cache_age:
+                _, context_id = heapq.heappop(heap)
+                context = self._context_cache.get(context_id)
+                if (
+                    context is not None
+                    and current_time - context.created_at > self._max_cache_age
+                ):
+                    del self._context_cache[context_id]
+                    self._created_at_total -= context.created_at
 
-            for key in expired_keys:
-                del self._context_cache[key]
-                self._last_access_times.pop(key, None)
+            # Replay queued hits while the cache lock is already held
+            self._apply_pending_touches()
 
     def clear_context(self, context_id: str) -> bool:
         """
@@ -958,27 +1455,26 @@ class TemporalIsolationEngine:
         Returns:
             True if context was found and removed, False otherwise
         """
-        with self._cache_lock:  # Write lock for cache modification
-            context_existed = self._context_cache.pop(context_id, None) is not None
-            self._last_access_times.pop(context_id, None)
-            return context_existed
+        with self._cache_lock:  # Lock for cache modification
+            context = self._context_cache.pop(context_id, None)
+            if context is None:
+                return False
+
+            self._created_at_total -= context.created_at
+            return True
 
     def get_cache_stats(self) -> dict[str, Any]:
         """Get cache statistics for monitoring."""
-        with ReadLockContext(self._cache_lock):  # Read lock for stats
-            current_time = time.time()
+        with self._cache_lock:
+            count = len(self._context_cache)
 
-            # Calculate age distribution
-            ages = [
-                current_time - context.created_at
-                for context in self._context_cache.values()
-            ]
-            avg_age = sum(ages) / len(ages) if ages else 0
+            # Mean age from the running created_at total, no per-entry scan
+            avg_age = time.monotonic() - self._created_at_total / count if count else 0
 
             return {
-                "cached_contexts": len(self._context_cache),
+                "cached_contexts": count,
                 "max_cache_size": self._max_cache_size,
-                "cache_utilization": len(self._context_cache) / self._max_cache_size,
+                "cache_utilization": count / self._max_cache_size,
                 "max_cache_age": self._max_cache_age,
                 "average_context_age": avg_age,
                 "patterns_loaded": len(self.patterns),
@@ -999,10 +1495,12 @@ class TemporalIsolationEngine:
         Returns:
             Number of contexts that were cleared
         """
-        with self._cache_lock:  # Write lock for cache modification
+        with self._cache_lock:  # Lock for cache modification
             count = len(self._context_cache)
             self._context_cache.clear()
-            self._last_access_times.clear()
+            self._pending_touches.clear()
+            self._created_at_total = 0.0
+            self._expiry_heap.clear()
             return count
 
     # Performance monitoring methods
@@ -1016,7 +1514,9 @@ class TemporalIsolationEngine:
         Args:
             callback: Function to call with (event_type, event_data) parameters
         """
-        self._performance_callbacks.append(callback)
+        entry = (callback, asyncio.iscoroutinefunction(callback))
+        with self._callbacks_lock:
+            self._performance_callbacks += (entry,)
 
     def remove_performance_callback(self, callback: Callable) -> bool:
         """
@@ -1028,52 +1528,60 @@ class TemporalIsolationEngine:
         Returns:
             True if callback was found and removed, False otherwise
         """
-        try:
-            self._performance_callbacks.remove(callback)
-            return True
-        except ValueError:
+        with self._callbacks_lock:
+            callbacks = self._performance_callbacks
+            for index, (registered, _) in enumerate(callbacks):
+                if registered == callback:
+                    self._performance_callbacks = (
+                        callbacks[:index] + callbacks[index + 1 :]
+                    )
+                    return True
             return False
 
     async def _trigger_performance_callbacks(
         self, event_type: str, event_data: dict[str, Any]
     ) -> None:
         """Trigger all registered performance callbacks."""
-        for callback in self._performance_callbacks:
+        callbacks = self._performance_callbacks
+        if not callbacks:
+            return
+
+        for callback, is_async in callbacks:
             try:
-                if asyncio.iscoroutinefunction(callback):
+                if is_async:
                     await callback(event_type, event_data)
                 else:
                     callback(event_type, event_data)
             except Exception as e:
                 # Log callback errors but don't fail the operation
-                import logging
-
-                logging.getLogger(__name__).warning(f"Performance callback failed: {e}")
+                logger.warning(f"Performance callback failed: {e}")
 
     def _update_sanitization_metrics(
-        self, duration_ms: float, secrets_count: int
+        self, duration_ms: float, secrets_count: int, calls: int = 1
     ) -> None:
         """Update sanitization performance metrics."""
-        self._performance_metrics["sanitization_calls"] += 1
-        self._performance_metrics["secrets_detected"] += secrets_count
-        self._performance_metrics["total_sanitization_time"] += duration_ms
+        metrics = self._performance_metrics
+        metrics.sanitization_calls += calls
+        metrics.secrets_detected += secrets_count
+        metrics.total_sanitization_time += duration_ms
 
         # Update average
-        calls = self._performance_metrics["sanitization_calls"]
-        total_time = self._performance_metrics["total_sanitization_time"]
-        self._performance_metrics["avg_sanitization_time"] = total_time / calls
+        metrics.avg_sanitization_time = (
+            metrics.total_sanitization_time / metrics.sanitization_calls
+        )
 
     def _update_resolution_metrics(
         self, duration_ms: float, resolved_count: int
     ) -> None:
         """Update resolution performance metrics."""
-        self._performance_metrics["resolution_calls"] += 1
-        self._performance_metrics["total_resolution_time"] += duration_ms
+        metrics = self._performance_metrics
+        metrics.resolution_calls += 1
+        metrics.total_resolution_time += duration_ms
 
         # Update average
-        calls = self._performance_metrics["resolution_calls"]
-        total_time = self._performance_metrics["total_resolution_time"]
-        self._performance_metrics["avg_resolution_time"] = total_time / calls
+        metrics.avg_resolution_time = (
+            metrics.total_resolution_time / metrics.resolution_calls
+        )
 
     def get_performance_metrics(self) -> dict[str, Any]:
         """
@@ -1095,49 +1603,48 @@ class TemporalIsolationEngine:
                 - avg_secrets_per_sanitization: Average secrets detected per call
         """
         cache_stats = self.get_cache_stats()
+        metrics = self._performance_metrics
 
         # Calculate additional derived metrics
-        total_calls = (
-            self._performance_metrics["sanitization_calls"]
-            + self._performance_metrics["resolution_calls"]
-        )
+        total_calls = metrics.sanitization_calls + metrics.resolution_calls
 
         cache_hit_rate = 0.0
-        if (
-            self._performance_metrics["cache_hits"]
-            + self._performance_metrics["cache_misses"]
-        ) > 0:
-            total_cache_ops = (
-                self._performance_metrics["cache_hits"]
-                + self._performance_metrics["cache_misses"]
-            )
-            cache_hit_rate = self._performance_metrics["cache_hits"] / total_cache_ops
+        total_cache_ops = metrics.cache_hits + metrics.cache_misses
+        if total_cache_ops > 0:
+            cache_hit_rate = metrics.cache_hits / total_cache_ops
 
         return {
-            **self._performance_metrics,
+            **asdict(metrics),
             "cache_stats": cache_stats,
             "total_operations": total_calls,
             "cache_hit_rate": cache_hit_rate,
             "performance_violation_rate": (
-                self._performance_metrics["performance_violations"] / total_calls
-                if total_calls > 0
-                else 0.0
+                metrics.performance_violations / total_calls if total_calls > 0 else 0.0
             ),
             "avg_secrets_per_sanitization": (
-                self._performance_metrics["secrets_detected"]
-                / self._performance_metrics["sanitization_calls"]
-                if self._performance_metrics["sanitization_calls"] > 0
+                metrics.secrets_detected / metrics.sanitization_calls
+                if metrics.sanitization_calls > 0
                 else 0.0
             ),
         }
 
     def reset_performance_metrics(self) -> None:
         """Reset all performance metrics to zero."""
-        for key in self._performance_metrics:
-            if isinstance(self._performance_metrics[key], int | float):
-                self._performance_metrics[key] = (
-                    0 if isinstance(self._performance_metrics[key], int) else 0.0
-                )
+        self._performance_metrics = _PerformanceMetrics()
+        self._reset_cache_counters()
+
+    def _reset_cache_counters(self) -> None:
+        """
+        Start fresh hit/miss counters for the lock-free cache lookup path.
+
+        ``next()`` on an ``itertools.count`` is a single C call, so concurrent
+        lookups never lose increments the way ``+= 1`` can. Each lookup
+        publishes the value it drew; when lookups race, the published value
+        can trail the counter until the next lookup, but lost updates never
+        accumulate.
+        """
+        self._cache_hit_counter = itertools.count(1)
+        self._cache_miss_counter = itertools.count(1)
 
     async def sanitize_traceback(self, error: Exception) -> Exception:
         """
@@ -1152,34 +1659,24 @@ class TemporalIsolationEngine:
         Returns:
             New exception with sanitized traceback
         """
-        import traceback
-
         # Get the original traceback
         original_tb = error.__traceback__
         if not original_tb:
             return error
 
-        # Extract traceback information
-        tb_lines = traceback.format_exception(type(error), error, original_tb)
-
-        # Sanitize each line of the traceback
-        sanitized_lines = []
-        for line in tb_lines:
-            # Sanitize file paths and sensitive content
-            sanitized_line = await self._sanitize_traceback_line(line)
-            sanitized_lines.append(sanitized_line)
+        # Only the exception message is kept, so format just that part
+        # instead of every frame of the traceback
+        message_lines = traceback.format_exception_only(type(error), error)
 
         # Create new exception with sanitized message
-        if sanitized_lines:
-            sanitized_message = sanitized_lines[
-                -1
-            ].strip()  # Only keep the exception message
-            # Additional sanitization for error message content
-            import re
-
+        if message_lines:
+            # Sanitize file paths and sensitive content
+            sanitized_message = (
+                await self._sanitize_traceback_line(message_lines[-1])
+            ).strip()
             # Remove specific line numbers from error messages
-            sanitized_message = re.sub(
-                r"line \d+", "line <redacted>", sanitized_message
+            sanitized_message = _MESSAGE_LINENO.sub(
+                "line <redacted>", sanitized_message
             )
             # Apply general sanitization to the error message
             error_data = await self.sanitize_for_ai(sanitized_message)
@@ -1195,23 +1692,27 @@ class TemporalIsolationEngine:
         return sanitized_error
 
     async def _sanitize_traceback_line(self, line: str) -> str:
-        """Sanitize a single traceback line to remove sensitive information."""
-        # Sanitize the line using our standard sanitization
-        sanitized_data = await self.sanitize_for_ai(line)
-        sanitized_line = sanitized_data.data
+        """
+        Sanitize a single traceback line to remove sensitive information.
 
-        # Additional traceback-specific sanitization
-        import re
+        Secrets are masked with the detection and replacement primitives
+        directly. Most lines fail the literal prefilter and skip the pattern
+        scan, and no resolvable context is cached for a one-off message.
+        """
+        sanitized_line = line
+        detected = self._detect_secrets_in_string(line)
+        if detected:
+            sanitized_line = self._replace_secrets_in_string(
+                line, _unique_secrets(detected), {}
+            )
 
         # Replace absolute paths with relative paths
-        sanitized_line = re.sub(
-            r'File "([^"]*)/([^"/]+/[^"/]+)"',
-            r'File ".../<sanitized_path>/\2"',
-            sanitized_line,
+        sanitized_line = _TRACEBACK_PATH.sub(
+            r'File ".../<sanitized_path>/\2"', sanitized_line
         )
 
         # Remove line numbers that might reveal code structure
-        sanitized_line = re.sub(r", line \d+", ", line <redacted>", sanitized_line)
+        sanitized_line = _TRACEBACK_LINENO.sub(", line <redacted>", sanitized_line)
 
         # Remove local variable information
         if "local variables:" in sanitized_line.lower():
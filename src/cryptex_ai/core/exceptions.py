@@ -4,6 +4,22 @@ import re
 import time
 from typing import Any
 
+# Redactions applied to every error message, in order: provider-specific
+# keys first, then generic long tokens, then file paths
+_MESSAGE_REDACTIONS = (
+    # OpenAI API keys
+    (re.compile(r"sk-[a-zA-Z0-9]{48}"), "[OPENAI_KEY_REDACTED]"),
+    (re.compile(r"sk-proj-[a-zA-Z0-9]{48}"), "[OPENAI_PROJECT_KEY_REDACTED]"),
+    (re.compile(r"sk-ant-[a-zA-Z0-9]{48}"), "[ANTHROPIC_KEY_REDACTED]"),
+    # GitHub tokens
+    (re.compile(r"ghp_[a-zA-Z0-9]{36}"), "[GITHUB_TOKEN_REDACTED]"),
+    (re.compile(r"gho_[a-zA-Z0-9]{36}"), "[GITHUB_OAUTH_REDACTED]"),
+    # Generic API keys (common patterns)
+    (re.compile(r"[a-zA-Z0-9]{32,}"), "[KEY_REDACTED]"),
+    # File paths that might contain sensitive info
+    (re.compile(r"/[/\w\-\.]+/[/\w\-\.]+"), "/[PATH_REDACTED]"),
+)
+
 
 class CryptexError(Exception):
     """
@@ -45,26 +61,8 @@ class CryptexError(Exception):
         if not message:
             return message
 
-        # Remove OpenAI API keys
-        message = re.sub(r"sk-[a-zA-Z0-9]{48}", "[OPENAI_KEY_REDACTED]", message)
-        message = re.sub(
-            r"sk-proj-[a-zA-Z0-9]{48}", "[OPENAI_PROJECT_KEY_REDACTED]", message
-        )
-        message = re.sub(r"sk-ant-[a-zA-Z0-9]{48}", "[ANTHROPIC_KEY_REDACTED]", message)
-
-        # Remove GitHub tokens
-        message = re.sub(r"ghp_[a-zA-Z0-9]{36}", "[GITHUB_TOKEN_REDACTED]", message)
-        message = re.sub(r"gho_[a-zA-Z0-9]{36}", "[GITHUB_OAUTH_REDACTED]", message)
-
-        # Remove generic API keys (common patterns)
-        message = re.sub(
-            r"[a-zA-Z0-9]{32,}",
-            lambda m: "[KEY_REDACTED]" if len(m.group()) >= 32 else m.group(),
-            message,
-        )
-
-        # Remove file paths that might contain sensitive info
-        message = re.sub(r"/[/\w\-\.]+/[/\w\-\.]+", "/[PATH_REDACTED]", message)
+        for pattern, replacement in _MESSAGE_REDACTIONS:
+            message = pattern.sub(replacement, message)
 
         return message
 
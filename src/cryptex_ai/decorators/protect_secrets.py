@@ -6,9 +6,12 @@ in any Python function, regardless of framework.
 """
 
 import asyncio
+import concurrent.futures
 import functools
 import sys
-from collections.abc import Callable
+import threading
+import weakref
+from collections.abc import Callable, Coroutine, Sequence
 from contextlib import contextmanager
 from typing import Any, TypeVar
 
@@ -17,9 +20,58 @@ from ..patterns import get_all_patterns
 
 F = TypeVar("F", bound=Callable[..., Any])
 
+# Secret sets for the convenience decorators, shared by every decoration
+_FILE_SECRETS = ("file_path",)
+_API_KEY_SECRETS = ("openai_key", "anthropic_key")
+_TOKEN_SECRETS = ("github_token",)
+_DATABASE_SECRETS = ("database_url",)
+_ALL_SECRETS = (
+    "openai_key",
+    "anthropic_key",
+    "github_token",
+    "file_path",
+    "database_url",
+)
+
+# Event loops reused by sync wrappers called outside any running loop
+_thread_loops = threading.local()
+
+
+def _run_on_thread_loop(coro: Coroutine[Any, Any, Any]) -> Any:
+    """
+    Run a coroutine to completion on this thread's reusable event loop.
+
+    asyncio.run() creates and tears down a loop on every call, which costs
+    more than the protected call itself. Keeping one loop per thread means
+    sync functions still execute on the calling thread. As with asyncio.run(),
+    tasks the call started (such as the engine's background cleanup) are
+    cancelled before returning, so nothing is left pending on the parked loop
+    and the loop can be closed once the thread is gone.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    loop = getattr(_thread_loops, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        _thread_loops.loop = loop
+        weakref.finalize(threading.current_thread(), loop.close)
+
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        leftover = asyncio.all_tasks(loop)
+        if leftover:
+            for task in leftover:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*leftover, return_exceptions=True))
+
 
 def protect_secrets(
-    secrets: list[str] | None = None,
+    secrets: Sequence[str] | None = None,
     auto_detect: bool = True,
     engine: TemporalIsolationEngine | None = None,
 ) -> Callable[[F], F]:
@@ -30,7 +82,7 @@ def protect_secrets(
     while providing real values for function execution.
 
     Args:
-        secrets: List of secret names/patterns to protect (e.g., ["openai_key"])
+        secrets: Secret names/patterns to protect (e.g., ["openai_key"])
         auto_detect: Whether to auto-detect additional secrets beyond specified list
         engine: Pre-configured TemporalIsolationEngine instance
 
@@ -71,7 +123,7 @@ def protect_secrets(
     """
     # Set up defaults
     if secrets is None:
-        secrets = []
+        secrets = ()
 
     def decorator(func: F) -> F:
         # Initialize protection
@@ -85,7 +137,7 @@ def protect_secrets(
 
             @functools.wraps(func)
             async def async_wrapper(*args, **kwargs) -> Any:
-                return await protection.protect_call(func, *args, **kwargs)
+                return await protection._protect_call(func, True, args, kwargs)
 
             return async_wrapper
         else:
@@ -95,28 +147,28 @@ def protect_secrets(
                 try:
                     # Try to use existing event loop if available
                     asyncio.get_running_loop()
-                    # If we have a running loop, we need to run in a new thread
-                    import concurrent.futures
-
-                    # Create a new event loop in a separate thread
-                    def run_in_new_loop():
-                        new_loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(new_loop)
-                        try:
-                            return new_loop.run_until_complete(
-                                protection.protect_call(func, *args, **kwargs)
-                            )
-                        finally:
-                            new_loop.close()
-
-                    # Run in thread pool to avoid blocking
-                    with concurrent.futures.ThreadPoolExecutor() as executor:
-                        future = executor.submit(run_in_new_loop)
-                        return future.result()
-
                 except RuntimeError:
-                    # No event loop running, safe to use asyncio.run
-                    return asyncio.run(protection.protect_call(func, *args, **kwargs))
+                    # No event loop running, safe to reuse this thread's loop
+                    return _run_on_thread_loop(
+                        protection._protect_call(func, False, args, kwargs)
+                    )
+
+                # If we have a running loop, we need to run in a new thread
+                # Create a new event loop in a separate thread
+                def run_in_new_loop():
+                    new_loop = asyncio.new_event_loop()
+                    asyncio.set_event_loop(new_loop)
+                    try:
+                        return new_loop.run_until_complete(
+                            protection._protect_call(func, False, args, kwargs)
+                        )
+                    finally:
+                        new_loop.close()
+
+                # Run in thread pool to avoid blocking
+                with concurrent.futures.ThreadPoolExecutor() as executor:
+                    future = executor.submit(run_in_new_loop)
+                    return future.result()
 
             return sync_wrapper
 
@@ -140,7 +192,7 @@ class UniversalProtection:
     def __init__(
         self,
         engine: TemporalIsolationEngine | None,
-        secrets: list[str],
+        secrets: Sequence[str],
         auto_detect: bool = True,
     ):
         """
@@ -154,7 +206,7 @@ class UniversalProtection:
         Raises:
             ValueError: If secrets list contains invalid pattern names
         """
-        self.secrets = secrets
+        self.secrets = list(secrets)
         self.auto_detect = auto_detect
         self._engine = engine
         self._initialized = False
@@ -262,7 +314,34 @@ class UniversalProtection:
             SecurityError: If secret isolation is compromised
             PerformanceError: If operation exceeds performance thresholds
         """
-        await self._ensure_initialized()
+        return await self._protect_call(
+            func, asyncio.iscoroutinefunction(func), args, kwargs
+        )
+
+    async def _protect_call(
+        self,
+        func: Callable,
+        is_coroutine: bool,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Any:
+        """
+        Run the three protection phases for an already-classified function.
+
+        The decorator wrappers call this directly, since whether ``func`` is
+        a coroutine function is known once at decoration time.
+
+        Args:
+            func: The function to execute
+            is_coroutine: Whether ``func`` must be awaited
+            args: Positional arguments
+            kwargs: Keyword arguments
+
+        Returns:
+            Function result with secrets properly isolated
+        """
+        if not self._initialized:
+            await self._ensure_initialized()
 
         try:
             # Phase 1: Sanitize input data for AI context
@@ -273,7 +352,7 @@ class UniversalProtection:
             # Phase 2: Execute function with AI call interception
             # Create monkey-patch context that intercepts AI library calls
             with self._create_ai_interception_context():
-                if asyncio.iscoroutinefunction(func):
+                if is_coroutine:
                     result = await func(*args, **kwargs)
                 else:
                     result = func(*args, **kwargs)
@@ -306,7 +385,7 @@ def protect_files(auto_detect: bool = True) -> Callable[[F], F]:
     Raises:
         PatternNotFoundError: If file_path pattern is not registered
     """
-    return protect_secrets(["file_path"], auto_detect=auto_detect)
+    return protect_secrets(_FILE_SECRETS, auto_detect=auto_detect)
 
 
 def protect_api_keys(auto_detect: bool = True) -> Callable[[F], F]:
@@ -321,7 +400,7 @@ def protect_api_keys(auto_detect: bool = True) -> Callable[[F], F]:
     Raises:
         PatternNotFoundError: If API key patterns are not registered
     """
-    return protect_secrets(["openai_key", "anthropic_key"], auto_detect=auto_detect)
+    return protect_secrets(_API_KEY_SECRETS, auto_detect=auto_detect)
 
 
 def protect_tokens(auto_detect: bool = True) -> Callable[[F], F]:
@@ -336,7 +415,7 @@ def protect_tokens(auto_detect: bool = True) -> Callable[[F], F]:
     Raises:
         PatternNotFoundError: If token patterns are not registered
     """
-    return protect_secrets(["github_token"], auto_detect=auto_detect)
+    return protect_secrets(_TOKEN_SECRETS, auto_detect=auto_detect)
 
 
 def protect_database(auto_detect: bool = True) -> Callable[[F], F]:
@@ -351,7 +430,7 @@ def protect_database(auto_detect: bool = True) -> Callable[[F], F]:
     Raises:
         PatternNotFoundError: If database_url pattern is not registered
     """
-    return protect_secrets(["database_url"], auto_detect=auto_detect)
+    return protect_secrets(_DATABASE_SECRETS, auto_detect=auto_detect)
 
 
 def protect_all(auto_detect: bool = True) -> Callable[[F], F]:
@@ -366,7 +445,4 @@ def protect_all(auto_detect: bool = True) -> Callable[[F], F]:
     Raises:
         PatternNotFoundError: If any built-in patterns are not registered
     """
-    return protect_secrets(
-        ["openai_key", "anthropic_key", "github_token", "file_path", "database_url"],
-        auto_detect=auto_detect,
-    )
+    return protect_secrets(_ALL_SECRETS, auto_detect=auto_detect)
@@ -9,8 +9,6 @@ from collections.abc import Callable
 from typing import Any
 from unittest.mock import Mock
 
-import pytest
-
 from cryptex_ai import TemporalIsolationEngine, protect_secrets
 
 from .secret_samples import get_sample_secret
@@ -109,9 +107,7 @@ def verify_secret_pattern_detection(secret_type: str, should_detect: bool = True
     sample_secret = get_sample_secret(secret_type)
 
     # Test detection
-    detected_secrets = pytest.asyncio.run(
-        engine._detect_secrets_in_string(sample_secret)
-    )
+    detected_secrets = engine._detect_secrets_in_string(sample_secret)
 
     if should_detect:
         assert len(detected_secrets) > 0, (
@@ -80,6 +80,19 @@ class TestInputValidation:
 
         assert "exceeds maximum limit" in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    async def test_input_size_counts_nested_content(self):
+        """Test the size limit covers nested strings, not just the outer object."""
+        engine = TemporalIsolationEngine(max_data_size=1000, max_string_length=500)
+
+        # Every string is within limits, but together they exceed max_data_size
+        nested_data = {"batch": [{"text": "x" * 400} for _ in range(3)]}
+
+        with pytest.raises(SanitizationError) as exc_info:
+            await engine.sanitize_for_ai(nested_data)
+
+        assert "Input data size exceeds maximum limit" in str(exc_info.value)
+
     @pytest.mark.asyncio
     async def test_string_length_validation_failure(self):
         """Test that oversized strings fail validation."""
@@ -14,11 +14,24 @@ Test Coverage:
 """
 
 import asyncio
+import dataclasses
+import gc
+import re
+import time
+import weakref
 from unittest.mock import patch
 
 import pytest
 
-from cryptex_ai.core.engine import SanitizedData, SecretPattern, TemporalIsolationEngine
+from cryptex_ai.core.engine import (
+    DetectedSecret,
+    ResolvedData,
+    SanitizedData,
+    SecretPattern,
+    TemporalIsolationEngine,
+    _background_tasks,
+    _required_literal,
+)
 from cryptex_ai.core.exceptions import PerformanceError, SanitizationError
 from tests.fixtures.secret_samples import (
     get_expected_placeholder,
@@ -65,53 +78,140 @@ class TestTemporalIsolationEngineInitialization:
 class TestSecretDetection:
     """Test secret detection algorithms."""
 
-    @pytest.mark.asyncio
-    async def test_detect_openai_key(self):
+    def test_detect_openai_key(self):
         """Test OpenAI key detection."""
         engine = TemporalIsolationEngine()
         sample_key = get_sample_secret("openai_key")
 
-        detected = await engine._detect_secrets_in_string(sample_key)
+        detected = engine._detect_secrets_in_string(sample_key)
 
         assert len(detected) == 1
         assert detected[0].pattern_name == "openai_key"
         assert detected[0].value == sample_key
 
-    @pytest.mark.asyncio
-    async def test_detect_database_url(self):
+    def test_detect_database_url(self):
         """Test database URL detection."""
         engine = TemporalIsolationEngine()
         sample_url = get_sample_secret("database_url")
 
-        detected = await engine._detect_secrets_in_string(sample_url)
+        detected = engine._detect_secrets_in_string(sample_url)
 
         assert len(detected) == 1
         assert detected[0].pattern_name == "database_url"
         assert detected[0].value == sample_url
 
-    @pytest.mark.asyncio
-    async def test_detect_multiple_secrets(self):
+    def test_detect_multiple_secrets(self):
         """Test detection of multiple secrets in text."""
         engine = TemporalIsolationEngine()
         text = f"API key: {get_sample_secret('openai_key')}, DB: {get_sample_secret('database_url')}"
 
-        detected = await engine._detect_secrets(text)
+        detected = engine._detect_secrets(text)
 
         assert len(detected) == 2
         pattern_names = {s.pattern_name for s in detected}
         assert "openai_key" in pattern_names
         assert "database_url" in pattern_names
 
-    @pytest.mark.asyncio
-    async def test_no_false_positives(self):
+    def test_no_false_positives(self):
         """Test that non-secrets are not detected."""
         engine = TemporalIsolationEngine()
         non_secret = "just a regular string with no secrets"
 
-        detected = await engine._detect_secrets_in_string(non_secret)
+        detected = engine._detect_secrets_in_string(non_secret)
 
         assert len(detected) == 0
 
+    def test_skip_keys_are_not_scanned(self):
+        """Test values under skip_keys are ignored during detection."""
+        engine = TemporalIsolationEngine(skip_keys={"request_id"})
+        secret = get_sample_secret("openai_key")
+
+        detected = engine._detect_secrets(
+            {"request_id": secret, "meta": [1, 2.5, True, None], "key": secret}
+        )
+
+        assert len(detected) == 1
+        assert detected[0].pattern_name == "openai_key"
+
+    def test_union_pattern_reports_matches_in_text_order(self):
+        """Test single-pass detection reports each match with its pattern."""
+        engine = TemporalIsolationEngine()
+        assert engine._union_pattern is not None
+
+        token = get_sample_secret("github_token")
+        key = get_sample_secret("openai_key")
+        detected = engine._detect_secrets_in_string(f"{token} then {key}")
+
+        assert [s.pattern_name for s in detected] == ["github_token", "openai_key"]
+        assert detected[0].start_pos == 0
+        assert detected[1].value == key
+
+    @pytest.mark.asyncio
+    async def test_union_pattern_prefers_longest_overlapping_match(self):
+        """Test a later, longer pattern wins over an earlier prefix match."""
+        engine = TemporalIsolationEngine(
+            patterns=[
+                SecretPattern(
+                    name="short_key",
+                    pattern=re.compile(r"sk-[a-zA-Z0-9]{48}"),
+                    placeholder_template="{{SHORT_KEY}}",
+                ),
+                SecretPattern(
+                    name="long_key",
+                    pattern=re.compile(r"sk-[a-zA-Z0-9]{64}"),
+                    placeholder_template="{{LONG_KEY}}",
+                ),
+            ]
+        )
+        assert engine._union_pattern is not None
+        secret = "sk-" + "A" * 48 + "TAILSECRET123456"
+
+        result = await engine.sanitize_for_ai(f"key={secret}")
+        detected = engine._detect_secrets_in_bytes(f"key={secret}".encode())
+
+        assert result.data == "key={{LONG_KEY}}"
+        assert [(s.pattern_name, s.value) for s in detected] == [("long_key", secret)]
+
+    def test_backreference_pattern_falls_back_to_per_pattern_scan(self):
+        """Test patterns that cannot be combined are still detected."""
+        engine = TemporalIsolationEngine()
+        engine.add_pattern(
+            SecretPattern(
+                name="repeated",
+                pattern=re.compile(r"(x\d)-\1"),
+                placeholder_template="{{REPEATED}}",
+            )
+        )
+
+        assert engine._union_pattern is None
+        detected = engine._detect_secrets_in_string("id x7-x7 here")
+        assert [s.value for s in detected] == ["x7-x7"]
+
+    def test_required_literal_extraction(self):
+        """Test only mandatory top-level literals are used for prefiltering."""
+        assert _required_literal(re.compile(r"sk-[a-z]{4}")) == "sk-"
+        assert _required_literal(re.compile(r"(?:pg|mysql)://\S+")) == "://"
+        assert _required_literal(re.compile(r"ab?c")) == "a"
+        assert _required_literal(re.compile(r"(?i)token-\d+")) is None
+        assert _required_literal(re.compile(r"\d{16}")) is None
+
+    def test_prefilter_disabled_by_pattern_without_literal(self):
+        """Test a pattern with no required literal turns the prefilter off."""
+        engine = TemporalIsolationEngine()
+        assert engine._prefilter_literals is not None
+
+        engine.add_pattern(
+            SecretPattern(
+                name="card_number",
+                pattern=re.compile(r"\d{16}"),
+                placeholder_template="{{CARD}}",
+            )
+        )
+
+        assert engine._prefilter_literals is None
+        detected = engine._detect_secrets_in_string("card 1234567812345678")
+        assert [s.pattern_name for s in detected] == ["card_number"]
+
 
 class TestSanitization:
     """Test sanitization logic."""
@@ -156,6 +256,114 @@ class TestSanitization:
         assert secret not in str(result.data)  # Secret removed
         assert len(result.placeholders) > 0  # Placeholders recorded
 
+    @pytest.mark.asyncio
+    async def test_sanitize_repeated_secret_keeps_surrounding_text(self):
+        """Test every occurrence is replaced without corrupting the text."""
+        engine = TemporalIsolationEngine()
+        secret = get_sample_secret("openai_key")
+        placeholder = get_expected_placeholder("openai_key")
+
+        result = await engine.sanitize_for_ai(f"a {secret} b {secret} c")
+
+        assert result.data == f"a {placeholder} b {placeholder} c"
+
+    @pytest.mark.asyncio
+    async def test_sanitize_bytes_payloads(self):
+        """Test bytes and bytearray payloads are sanitized and restored."""
+        engine = TemporalIsolationEngine()
+        secret = get_sample_secret("openai_key")
+        placeholder = get_expected_placeholder("openai_key")
+        data = {
+            "body": f'{{"key": "{secret}"}}'.encode(),
+            "raw": bytearray(b"\xff " + secret.encode()),
+        }
+
+        result = await engine.sanitize_for_ai(data)
+
+        assert result.data["body"] == f'{{"key": "{placeholder}"}}'.encode()
+        assert result.data["raw"] == bytearray(b"\xff " + placeholder.encode())
+        assert isinstance(result.data["raw"], bytearray)
+
+        resolved = await engine.resolve_for_execution(result.data, result.context_id)
+        assert resolved.data == data
+
+    @pytest.mark.asyncio
+    async def test_sanitize_response_masks_leaked_bytes(self):
+        """Test real values leaking back as bytes are masked like strings."""
+        engine = TemporalIsolationEngine()
+        key = get_sample_secret("openai_key")
+
+        result = await engine.sanitize_for_ai({"cmd": f"echo {key}".encode()})
+        response = {"out": f"echo {key}".encode(), "buf": bytearray(key.encode())}
+
+        sanitized = await engine.sanitize_response(response, result.context_id)
+
+        placeholder = get_expected_placeholder("openai_key").encode()
+        assert sanitized == {"out": b"echo " + placeholder, "buf": placeholder}
+        assert isinstance(sanitized["buf"], bytearray)
+
+    @pytest.mark.asyncio
+    async def test_sanitize_response_replaces_leaked_values(self):
+        """Test real values leaking into a tool response are masked again."""
+        engine = TemporalIsolationEngine()
+        key = get_sample_secret("openai_key")
+        token = get_sample_secret("github_token")
+
+        result = await engine.sanitize_for_ai({"key": key, "token": token})
+        response = {"log": [f"used {key}", f"and {token} twice {token}"], "n": 3}
+
+        sanitized = await engine.sanitize_response(response, result.context_id)
+
+        openai_placeholder = get_expected_placeholder("openai_key")
+        github_placeholder = get_expected_placeholder("github_token")
+        assert sanitized == {
+            "log": [
+                f"used {openai_placeholder}",
+                f"and {github_placeholder} twice {github_placeholder}",
+            ],
+            "n": 3,
+        }
+
+    @pytest.mark.asyncio
+    async def test_sanitize_many(self):
+        """Test batch sanitization gives each item its own resolvable context."""
+        engine = TemporalIsolationEngine()
+        key = get_sample_secret("openai_key")
+        token = get_sample_secret("github_token")
+
+        results = await engine.sanitize_many([f"k={key}", "plain", {"t": token}])
+
+        assert results[0].data == f"k={get_expected_placeholder('openai_key')}"
+        assert results[1].data == "plain"
+        assert results[2].data == {"t": get_expected_placeholder("github_token")}
+        assert len({result.context_id for result in results}) == 3
+        assert engine.get_performance_metrics()["sanitization_calls"] == 3
+
+        resolved = await engine.resolve_for_execution(
+            results[2].data, results[2].context_id
+        )
+        assert resolved.data == {"t": token}
+
+    @pytest.mark.asyncio
+    async def test_sanitize_many_larger_than_cache(self):
+        """Test a batch bigger than the cache keeps the newest contexts."""
+        engine = TemporalIsolationEngine(max_cache_size=10)
+        key = get_sample_secret("openai_key")
+
+        results = await engine.sanitize_many([f"k={key}"] * 100)
+
+        assert all(
+            result.data == f"k={get_expected_placeholder('openai_key')}"
+            for result in results
+        )
+        assert engine.get_cache_stats()["cached_contexts"] == 10
+        assert len(engine._expiry_heap) <= 200
+
+        resolved = await engine.resolve_for_execution(
+            results[-1].data, results[-1].context_id
+        )
+        assert resolved.data == f"k={key}"
+
     @pytest.mark.asyncio
     async def test_sanitize_empty_data(self):
         """Test sanitization of empty/None data."""
@@ -169,6 +377,49 @@ class TestSanitization:
         assert len(result_none.placeholders) == 0
         assert len(result_empty.placeholders) == 0
 
+    def test_result_types_support_weakrefs(self):
+        """Test slotted result dataclasses can still be weakly referenced."""
+        context = SanitizedData(data=None)
+        for value in (context, ResolvedData(data=None), DetectedSecret("v", "p", "x")):
+            assert weakref.ref(value)() is value
+        assert [f.name for f in dataclasses.fields(context)] == [
+            "data",
+            "placeholders",
+            "context_id",
+            "created_at",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_resolve_large_placeholder_map(self):
+        """Test contexts with many placeholders resolve through one regex pass."""
+        engine = TemporalIsolationEngine()
+        placeholders = {f"{{{{SECRET_{i}}}}}": f"value-{i}" for i in range(20)}
+        context = SanitizedData(data=None, placeholders=placeholders, context_id="big")
+        engine._cache_context("big", context)
+
+        resolved = await engine.resolve_for_execution(
+            ["{{SECRET_1}} {{SECRET_12}} {{SECRET_1}}", b"{{SECRET_3}}"], "big"
+        )
+
+        assert resolved.data == ["value-1 value-12 value-1", b"value-3"]
+        assert resolved.resolved_count == 3
+
+    @pytest.mark.asyncio
+    async def test_resolve_large_placeholder_map_after_changes(self):
+        """Test placeholders added or removed after a resolve are honoured."""
+        engine = TemporalIsolationEngine()
+        placeholders = {f"{{{{S_{i}}}}}": f"value-{i}" for i in range(20)}
+        context = SanitizedData(data=None, placeholders=placeholders, context_id="big")
+        engine._cache_context("big", context)
+        await engine.resolve_for_execution("{{S_1}}", "big")
+
+        placeholders["{{NEW}}"] = "new-value"
+        del placeholders["{{S_2}}"]
+        resolved = await engine.resolve_for_execution("{{NEW}} {{S_2}} {{S_3}}", "big")
+
+        assert resolved.data == "new-value {{S_2}} value-3"
+        assert resolved.resolved_count == 2
+
 
 class TestPlaceholderGeneration:
     """Test placeholder generation logic."""
@@ -225,6 +476,78 @@ class TestCacheManagement:
         stats = engine.get_cache_stats()
         assert stats["cached_contexts"] <= 2
 
+    def test_cache_evicts_least_recently_used(self):
+        """Test a cache hit protects a context from the next eviction."""
+        engine = TemporalIsolationEngine(max_cache_size=2)
+        for context_id in ("first", "second"):
+            engine._cache_context(
+                context_id, SanitizedData(data=context_id, context_id=context_id)
+            )
+
+        # Touch the oldest entry, then push a third one in
+        assert engine._get_cached_context("first") is not None
+        engine._cache_context("third", SanitizedData(data="3", context_id="third"))
+
+        assert engine._get_cached_context("second") is None
+        assert engine._get_cached_context("first") is not None
+        assert engine._get_cached_context("third") is not None
+
+    def test_cache_stats_average_age_tracks_evictions(self):
+        """Test the running average age stays exact as contexts come and go."""
+        engine = TemporalIsolationEngine(max_cache_size=2)
+        now = time.monotonic()
+        for context_id, age in (("a", 30.0), ("b", 20.0), ("c", 10.0)):
+            context = SanitizedData(data=None, context_id=context_id)
+            context.created_at = now - age
+            engine._cache_context(context_id, context)
+
+        # "a" was evicted, leaving contexts aged 20s and 10s
+        assert engine.get_cache_stats()["average_context_age"] == pytest.approx(
+            15.0, abs=0.5
+        )
+
+        engine.clear_context("b")
+        assert engine.get_cache_stats()["average_context_age"] == pytest.approx(
+            10.0, abs=0.5
+        )
+
+        engine.clear_all_contexts()
+        assert engine.get_cache_stats()["average_context_age"] == 0
+
+    def test_clean_expired_cache_removes_only_expired(self):
+        """Test expiry drops old contexts and ignores stale heap entries."""
+        engine = TemporalIsolationEngine(max_cache_age=60)
+        now = time.monotonic()
+        for context_id, age in (("old", 120.0), ("cleared", 90.0), ("new", 5.0)):
+            context = SanitizedData(data=None, context_id=context_id)
+            context.created_at = now - age
+            engine._cache_context(context_id, context)
+        engine.clear_context("cleared")
+
+        engine._clean_expired_cache()
+
+        assert engine._get_cached_context("old") is None
+        assert engine._get_cached_context("new") is not None
+        assert engine.get_cache_stats()["cached_contexts"] == 1
+
+    @pytest.mark.asyncio
+    async def test_background_cleanup_task_does_not_pin_engine(self):
+        """Test the cleanup task is strongly held but the engine can be collected."""
+        engine = TemporalIsolationEngine()
+        engine._start_background_cleanup()
+        task = engine._cleanup_task
+        engine_ref = weakref.ref(engine)
+
+        assert task in _background_tasks
+
+        del engine
+        gc.collect()
+        assert engine_ref() is None
+
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        assert task not in _background_tasks
+
     def test_clear_context(self):
         """Test manual context clearing."""
         engine = TemporalIsolationEngine()
@@ -266,9 +589,9 @@ class TestPerformanceMonitoring:
         """Test performance threshold violations."""
         engine = TemporalIsolationEngine()
 
-        # Mock slow sanitization with async coroutine
-        async def slow_detect_secrets(data):
-            await asyncio.sleep(0.006)  # Sleep for 6ms to exceed 5ms threshold
+        # Mock slow secret detection
+        def slow_detect_secrets(data):
+            time.sleep(0.006)  # Sleep for 6ms to exceed 5ms threshold
             return []  # Return empty list of detected secrets
 
         with patch.object(engine, "_detect_secrets", side_effect=slow_detect_secrets):
@@ -280,6 +603,32 @@ class TestPerformanceMonitoring:
                 # This is what we expect
                 pass
 
+    @pytest.mark.asyncio
+    async def test_performance_callbacks_sync_and_async(self):
+        """Test sync and async callbacks both fire, and removal stops them."""
+        engine = TemporalIsolationEngine()
+        events = []
+
+        def on_event(event_type, event_data):
+            events.append(("sync", event_type))
+
+        async def on_event_async(event_type, event_data):
+            events.append(("async", event_type))
+
+        engine.add_performance_callback(on_event)
+        engine.add_performance_callback(on_event_async)
+        await engine._trigger_performance_callbacks("sanitization_timeout", {})
+
+        assert engine.remove_performance_callback(on_event) is True
+        assert engine.remove_performance_callback(on_event) is False
+        await engine._trigger_performance_callbacks("resolution_timeout", {})
+
+        assert events == [
+            ("sync", "sanitization_timeout"),
+            ("async", "sanitization_timeout"),
+            ("async", "resolution_timeout"),
+        ]
+
     def test_reset_performance_metrics(self):
         """Test performance metrics reset."""
         engine = TemporalIsolationEngine()
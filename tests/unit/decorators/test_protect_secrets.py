@@ -155,6 +155,14 @@ class TestUniversalProtectionClass:
         assert protection._engine is None
         assert protection._initialized is False
 
+    def test_universal_protection_stores_secrets_as_list(self):
+        """Test secrets passed as a tuple are exposed as a mutable list."""
+        protection = UniversalProtection(engine=None, secrets=("file_path",))
+
+        protection.secrets.append("github_token")
+
+        assert protection.secrets == ["file_path", "github_token"]
+
     @pytest.mark.asyncio
     async def test_ensure_initialized_creates_engine(self):
         """Test that _ensure_initialized creates engine when needed."""
@@ -343,3 +351,43 @@ class TestEventLoopHandling:
 
         result = standalone_function(get_sample_secret("database_url"))
         assert "standalone" in str(result)
+
+    def test_sync_function_reuses_thread_loop(self):
+        """Test sync calls outside a loop stay on the caller's thread and loop."""
+        import threading
+
+        from cryptex_ai.decorators.protect_secrets import _thread_loops
+
+        threads = []
+
+        @protect_secrets(["openai_key"])
+        def record_thread(api_key: str) -> str:
+            threads.append(threading.current_thread())
+            return "recorded"
+
+        record_thread(get_sample_secret("openai_key"))
+        first_loop = _thread_loops.loop
+        record_thread(get_sample_secret("openai_key"))
+
+        assert _thread_loops.loop is first_loop
+        assert threads == [threading.current_thread()] * 2
+
+    def test_sync_call_finishes_background_cleanup_task(self):
+        """Test tasks started by a sync call are finished before it returns."""
+        from cryptex_ai.core.engine import TemporalIsolationEngine
+        from cryptex_ai.decorators.protect_secrets import _thread_loops
+
+        engine = TemporalIsolationEngine(enable_background_cleanup=True)
+
+        @protect_secrets(["openai_key"], engine=engine)
+        def uses_key(api_key: str) -> str:
+            return "used"
+
+        uses_key(get_sample_secret("openai_key"))
+        first_task = engine._cleanup_task
+        uses_key(get_sample_secret("openai_key"))
+
+        assert first_task is not None and first_task.done()
+        assert engine._cleanup_task is not first_task
+        assert engine._cleanup_task.done()
+        assert not asyncio.all_tasks(_thread_loops.loop)